@@ -1577,6 +1577,9 @@ IMPORT_CACHE_FILE = "stdlib_cache.json"
 IMPORT_CACHE_KEY = "cache"
 IMPORT_TIMESTAMPS_KEY = "timestamps"
 
+# (H) Path resolver cache config
+RESOLVER_FQN_CACHE_SIZE = 4096
+
 # (H) Tree-sitter Python import node types
 TS_IMPORT_STATEMENT = "import_statement"
 TS_IMPORT_FROM_STATEMENT = "import_from_statement"
@@ -39,6 +39,9 @@ DATA_NOT_LOADED = "Data should be loaded"
 # (H) Parser errors
 NO_LANGUAGES = "No Tree-sitter languages available."
 
+# (H) Path resolver errors
+RESOLVER_UNKNOWN_PROJECT = "Unknown project '{name}'. Available projects: {available}"
+
 # (H) LLM errors
 LLM_INIT_CYPHER = "Failed to initialize CypherGenerator: {error}"
 LLM_INVALID_QUERY = "LLM did not generate a valid query. Output: {output}"
@@ -145,6 +145,13 @@ FQN_RESOLVE_FAILED = "Failed to resolve FQN for node at {path}: {error}"
 FQN_FIND_FAILED = "Failed to find function by FQN {fqn} in {path}: {error}"
 FQN_EXTRACT_FAILED = "Failed to extract function FQNs from {path}: {error}"
 
+# (H) Project path resolver logs
+RESOLVER_INITIALIZED = "ProjectPathResolver initialized with projects: {projects}"
+RESOLVER_PROJECT_ADDED = "Registered project '{name}' at {path}"
+RESOLVER_PROJECT_REMOVED = "Removed project '{name}'"
+RESOLVER_EXTRACT_SUCCESS = "Resolved FQN '{fqn}' to project '{project}'"
+RESOLVER_EXTRACT_FALLBACK = "No project matched FQN '{fqn}'; using first segment"
+
 # (H) Source extraction logs
 SOURCE_FILE_NOT_FOUND = "Source file not found: {path}"
 SOURCE_INVALID_RANGE = "Invalid line range: {start}-{end}"
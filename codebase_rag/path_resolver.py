@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import functools
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from . import exceptions as ex
+from . import logs as ls
+from .constants import RESOLVER_FQN_CACHE_SIZE, SEPARATOR_DOT
+
+if TYPE_CHECKING:
+    from .config import AppConfig
+
+
+# (H) Deferred to break the import cycle with config; cached after the first call
+@functools.cache
+def _get_settings() -> AppConfig:
+    from .config import settings
+
+    return settings
+
+
+# (H) Process-global: stale if symlinks change mid-run; clear via _realpath.cache_clear()
+@functools.lru_cache(maxsize=1024)
+def _realpath(path: str) -> str:
+    return os.path.realpath(path)
+
+
+@dataclass
+class _TrieNode:
+    children: dict[str, _TrieNode] = field(default_factory=dict)
+    terminal: str | None = None
+
+
+class ProjectPathResolver:
+    __slots__ = (
+        "_mappings",
+        "_trie",
+        "_sorted_keys",
+        "_fqn_cache",
+        "_single",
+        "_single_prefix",
+    )
+
+    def __init__(
+        self,
+        mappings: dict[str, str | Path] | None = None,
+        config: AppConfig | None = None,
+    ) -> None:
+        if mappings is None:
+            if config is None:
+                config = _get_settings()
+            repo_path = _realpath(config.TARGET_REPO_PATH)
+            mappings = {os.path.basename(repo_path): repo_path}
+        self._mappings: dict[str, str] = {
+            sys.intern(name): _realpath(os.fspath(path))
+            for name, path in mappings.items()
+        }
+        self._trie = _TrieNode()
+        for name in self._mappings:
+            self._trie_insert(name)
+        self._refresh_sorted_keys()
+        self._refresh_single()
+        self._fqn_cache: OrderedDict[str, str] = OrderedDict()
+        logger.info(ls.RESOLVER_INITIALIZED, projects=self._sorted_keys)
+
+    def _trie_insert(self, project_name: str) -> None:
+        node = self._trie
+        for segment in project_name.split(SEPARATOR_DOT):
+            node = node.children.setdefault(segment, _TrieNode())
+        node.terminal = project_name
+
+    def _refresh_sorted_keys(self) -> None:
+        self._sorted_keys = sorted(
+            self._mappings, key=lambda k: k.count(SEPARATOR_DOT), reverse=True
+        )
+
+    def _refresh_single(self) -> None:
+        if len(self._mappings) == 1:
+            self._single: str | None = next(iter(self._mappings))
+            self._single_prefix = self._single + SEPARATOR_DOT
+        else:
+            self._single = None
+            self._single_prefix = ""
+
+    def _rebuild_trie(self) -> None:
+        self._trie = _TrieNode()
+        for name in self._mappings:
+            self._trie_insert(name)
+
+    def add_project(self, project_name: str, path: str | Path) -> None:
+        project_name = sys.intern(project_name)
+        resolved = _realpath(os.fspath(path))
+        self._mappings[project_name] = resolved
+        self._trie_insert(project_name)
+        self._refresh_sorted_keys()
+        self._refresh_single()
+        self._fqn_cache.clear()
+        logger.info(ls.RESOLVER_PROJECT_ADDED, name=project_name, path=resolved)
+
+    def remove_project(self, project_name: str) -> None:
+        if project_name not in self._mappings:
+            raise KeyError(
+                ex.RESOLVER_UNKNOWN_PROJECT.format(
+                    name=project_name, available=", ".join(self._mappings)
+                )
+            )
+        del self._mappings[project_name]
+        self._rebuild_trie()
+        self._refresh_sorted_keys()
+        self._refresh_single()
+        self._fqn_cache.clear()
+        logger.info(ls.RESOLVER_PROJECT_REMOVED, name=project_name)
+
+    def get_project_path(self, project_name: str) -> Path:
+        if project_name not in self._mappings:
+            raise KeyError(
+                ex.RESOLVER_UNKNOWN_PROJECT.format(
+                    name=project_name, available=", ".join(self._mappings)
+                )
+            )
+        return Path(self._mappings[project_name])
+
+    def _cache_result(self, qualified_name: str, project_name: str) -> None:
+        if len(self._fqn_cache) >= RESOLVER_FQN_CACHE_SIZE:
+            self._fqn_cache.popitem(last=False)
+        self._fqn_cache[qualified_name] = project_name
+
+    def extract_project_name(self, qualified_name: str) -> str:
+        single = self._single
+        if single is not None:
+            if qualified_name == single or qualified_name.startswith(
+                self._single_prefix
+            ):
+                return single
+            return qualified_name.partition(SEPARATOR_DOT)[0]
+        cached = self._fqn_cache.get(qualified_name)
+        if cached is not None:
+            return cached
+        return self._extract_uncached(qualified_name)
+
+    def _extract_uncached(self, qualified_name: str) -> str:
+        parts = qualified_name.split(SEPARATOR_DOT)
+        node = self._trie
+        match: str | None = None
+        for part in parts:
+            child = node.children.get(part)
+            if child is None:
+                break
+            node = child
+            if node.terminal is not None:
+                match = node.terminal
+        if match is not None:
+            logger.debug(ls.RESOLVER_EXTRACT_SUCCESS, fqn=qualified_name, project=match)
+        else:
+            logger.debug(ls.RESOLVER_EXTRACT_FALLBACK, fqn=qualified_name)
+            match = parts[0]
+        self._cache_result(qualified_name, match)
+        return match
+
+    def resolve_path_from_fqn(self, qualified_name: str) -> Path:
+        return self.get_project_path(self.extract_project_name(qualified_name))
+
+    def extract_project_names(self, fqns: Iterable[str]) -> list[str]:
+        single = self._single
+        if single is not None:
+            prefix = self._single_prefix
+            return [
+                single
+                if fqn == single or fqn.startswith(prefix)
+                else fqn.partition(SEPARATOR_DOT)[0]
+                for fqn in fqns
+            ]
+        cache_get = self._fqn_cache.get
+        extract_uncached = self._extract_uncached
+        names: list[str] = []
+        append = names.append
+        for fqn in fqns:
+            name = cache_get(fqn)
+            if name is None:
+                name = extract_uncached(fqn)
+            append(name)
+        return names
+
+    def resolve_paths_from_fqns(self, fqns: Iterable[str]) -> list[Path]:
+        mappings = self._mappings
+        paths: list[Path] = []
+        append = paths.append
+        for name in self.extract_project_names(fqns):
+            path = mappings.get(name)
+            if path is None:
+                raise KeyError(
+                    ex.RESOLVER_UNKNOWN_PROJECT.format(
+                        name=name, available=", ".join(mappings)
+                    )
+                )
+            append(Path(path))
+        return paths
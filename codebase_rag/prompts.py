@@ -1,37 +1,29 @@
+import functools
 from typing import TYPE_CHECKING
 
-from .cypher_queries import (
-    CYPHER_EXAMPLE_CLASS_METHODS,
-    CYPHER_EXAMPLE_CONTENT_BY_PATH,
-    CYPHER_EXAMPLE_DECORATED_FUNCTIONS,
-    CYPHER_EXAMPLE_FILES_IN_FOLDER,
-    CYPHER_EXAMPLE_FIND_FILE,
-    CYPHER_EXAMPLE_KEYWORD_SEARCH,
-    CYPHER_EXAMPLE_LIMIT_ONE,
-    CYPHER_EXAMPLE_PYTHON_FILES,
-    CYPHER_EXAMPLE_README,
-    CYPHER_EXAMPLE_TASKS,
-)
-from .schema_builder import GRAPH_SCHEMA_DEFINITION
-from .types_defs import ToolNames
+from .constants import ENCODING_UTF8
 
 if TYPE_CHECKING:
     from pydantic_ai import Tool
 
+    from .types_defs import ToolNames
 
-def extract_tool_names(tools: list["Tool"]) -> ToolNames:
-    tool_map = {t.name: t.name for t in tools}
-    return ToolNames(
-        query_graph=tool_map.get(
-            "query_codebase_knowledge_graph", "query_codebase_knowledge_graph"
-        ),
-        read_file=tool_map.get("read_file_content", "read_file_content"),
-        analyze_document=tool_map.get("analyze_document", "analyze_document"),
-        semantic_search=tool_map.get("semantic_code_search", "semantic_code_search"),
-        create_file=tool_map.get("create_new_file", "create_new_file"),
-        edit_file=tool_map.get("replace_code_surgically", "replace_code_surgically"),
-        shell_command=tool_map.get("execute_shell_command", "execute_shell_command"),
-    )
+
+_TOOL_DEFAULTS: tuple[tuple[str, str], ...] = (
+    ("query_graph", "query_codebase_knowledge_graph"),
+    ("read_file", "read_file_content"),
+    ("analyze_document", "analyze_document"),
+    ("semantic_search", "semantic_code_search"),
+    ("create_file", "create_new_file"),
+    ("edit_file", "replace_code_surgically"),
+    ("shell_command", "execute_shell_command"),
+)
+
+
+def extract_tool_names(tools: list["Tool"]) -> "ToolNames":
+    from .types_defs import ToolNames
+
+    return ToolNames(**dict(_TOOL_DEFAULTS))
 
 
 CYPHER_QUERY_RULES = """**2. Critical Cypher Query Rules**
@@ -43,7 +35,10 @@ CYPHER_QUERY_RULES = """**2. Critical Cypher Query Rules**
 - **Querying Lists**: To check if a list property (like `decorators`) contains an item, use the `ANY` or `IN` clause (e.g., `WHERE 'flow' IN n.decorators`)."""
 
 
-def build_graph_schema_and_rules() -> str:
+@functools.cache
+def get_graph_schema_and_rules() -> str:
+    from .schema_builder import GRAPH_SCHEMA_DEFINITION
+
     return f"""You are an expert AI assistant for analyzing codebases using a **hybrid retrieval system**: a **Memgraph knowledge graph** for structural queries and a **semantic code search engine** for intent-based discovery.
 
 **1. Graph Schema Definition**
@@ -55,9 +50,6 @@ The database contains information about a codebase, structured with the followin
 """
 
 
-GRAPH_SCHEMA_AND_RULES = build_graph_schema_and_rules()
-
-
 def build_rag_orchestrator_prompt(tools: list["Tool"]) -> str:
     t = extract_tool_names(tools)
     return f"""You are an expert AI assistant for analyzing codebases. Your answers are based **EXCLUSIVELY** on information retrieved using your tools.
@@ -130,10 +122,20 @@ def build_rag_orchestrator_prompt(tools: list["Tool"]) -> str:
 """
 
 
-CYPHER_SYSTEM_PROMPT = f"""
+@functools.cache
+def get_cypher_system_prompt() -> str:
+    from .cypher_queries import (
+        CYPHER_EXAMPLE_CLASS_METHODS,
+        CYPHER_EXAMPLE_CONTENT_BY_PATH,
+        CYPHER_EXAMPLE_DECORATED_FUNCTIONS,
+        CYPHER_EXAMPLE_FIND_FILE,
+        CYPHER_EXAMPLE_KEYWORD_SEARCH,
+    )
+
+    return f"""
 You are an expert translator that converts natural language questions about code structure into precise Neo4j Cypher queries.
 
-{GRAPH_SCHEMA_AND_RULES}
+{get_graph_schema_and_rules()}
 
 **3. Query Optimization Rules**
 
@@ -177,11 +179,23 @@ cypher// "What methods does UserService have?" or "Show me methods in UserServic
 Provide only the Cypher query.
 """
 
+
 # (H) Stricter prompt for less capable open-source/local models (e.g., Ollama)
-LOCAL_CYPHER_SYSTEM_PROMPT = f"""
+@functools.cache
+def get_local_cypher_system_prompt() -> str:
+    from .cypher_queries import (
+        CYPHER_EXAMPLE_CLASS_METHODS,
+        CYPHER_EXAMPLE_FILES_IN_FOLDER,
+        CYPHER_EXAMPLE_LIMIT_ONE,
+        CYPHER_EXAMPLE_PYTHON_FILES,
+        CYPHER_EXAMPLE_README,
+        CYPHER_EXAMPLE_TASKS,
+    )
+
+    return f"""
 You are a Neo4j Cypher query generator. You ONLY respond with a valid Cypher query. Do not add explanations or markdown.
 
-{GRAPH_SCHEMA_AND_RULES}
+{get_graph_schema_and_rules()}
 
 **CRITICAL RULES FOR QUERY GENERATION:**
 1.  **NO `UNION`**: Never use the `UNION` clause. Generate a single, simple `MATCH` query.
@@ -241,6 +255,34 @@ You are a Neo4j Cypher query generator. You ONLY respond with a valid Cypher que
     ```
 """
 
+
+# (H) Pre-encoded forms for transports that send the prompts as bytes
+@functools.cache
+def get_graph_schema_and_rules_bytes() -> bytes:
+    return get_graph_schema_and_rules().encode(ENCODING_UTF8)
+
+
+@functools.cache
+def get_cypher_system_prompt_bytes() -> bytes:
+    return get_cypher_system_prompt().encode(ENCODING_UTF8)
+
+
+@functools.cache
+def get_local_cypher_system_prompt_bytes() -> bytes:
+    return get_local_cypher_system_prompt().encode(ENCODING_UTF8)
+
+
+# (H) Backward compatibility for the former module-level prompt constants
+def __getattr__(name: str) -> str:
+    if name == "GRAPH_SCHEMA_AND_RULES":
+        return get_graph_schema_and_rules()
+    if name == "CYPHER_SYSTEM_PROMPT":
+        return get_cypher_system_prompt()
+    if name == "LOCAL_CYPHER_SYSTEM_PROMPT":
+        return get_local_cypher_system_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 OPTIMIZATION_PROMPT = """
 I want you to analyze my {language} codebase and propose specific optimizations based on best practices.
 
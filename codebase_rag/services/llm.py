@@ -10,9 +10,9 @@ from .. import exceptions as ex
 from .. import logs as ls
 from ..config import ModelConfig, settings
 from ..prompts import (
-    CYPHER_SYSTEM_PROMPT,
-    LOCAL_CYPHER_SYSTEM_PROMPT,
     build_rag_orchestrator_prompt,
+    get_cypher_system_prompt,
+    get_local_cypher_system_prompt,
 )
 from ..providers.base import get_provider_from_config
 
@@ -41,9 +41,9 @@ class CypherGenerator:
             llm = _create_provider_model(config)
 
             system_prompt = (
-                LOCAL_CYPHER_SYSTEM_PROMPT
+                get_local_cypher_system_prompt()
                 if config.provider == cs.Provider.OLLAMA
-                else CYPHER_SYSTEM_PROMPT
+                else get_cypher_system_prompt()
             )
 
             self.agent = Agent(
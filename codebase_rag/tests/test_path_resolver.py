@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from codebase_rag.path_resolver import ProjectPathResolver
+
+
+@pytest.fixture
+def project_dirs(tmp_path: Path) -> dict[str, Path]:
+    dirs = {}
+    for name in ("alpha", "beta", "gamma"):
+        project_dir = tmp_path / name
+        project_dir.mkdir()
+        dirs[name] = project_dir
+    return dirs
+
+
+@pytest.fixture
+def resolver(project_dirs: dict[str, Path]) -> ProjectPathResolver:
+    mappings: dict[str, str | Path] = dict(project_dirs)
+    return ProjectPathResolver(mappings)
+
+
+class TestExtractProjectName:
+    def test_extracts_registered_project(self, resolver: ProjectPathResolver) -> None:
+        assert resolver.extract_project_name("alpha.module.Class.method") == "alpha"
+
+    def test_deepest_dotted_match_wins(self, tmp_path: Path) -> None:
+        mappings: dict[str, str | Path] = {"proj": tmp_path, "proj.sub": tmp_path}
+        resolver = ProjectPathResolver(mappings)
+        assert resolver.extract_project_name("proj.sub.module.func") == "proj.sub"
+        assert resolver.extract_project_name("proj.other.func") == "proj"
+
+    def test_handles_fqn_without_dots(self, resolver: ProjectPathResolver) -> None:
+        assert resolver.extract_project_name("unknown") == "unknown"
+
+    def test_exact_project_name_match(
+        self, resolver: ProjectPathResolver, project_dirs: dict[str, Path]
+    ) -> None:
+        assert resolver.extract_project_name("alpha") == "alpha"
+        assert (
+            resolver.resolve_path_from_fqn("alpha") == project_dirs["alpha"].resolve()
+        )
+
+    def test_no_match_on_partial_segment(self, resolver: ProjectPathResolver) -> None:
+        assert resolver.extract_project_name("alphabet.module.func") == "alphabet"
+
+    def test_repeated_lookups_are_cached(self, resolver: ProjectPathResolver) -> None:
+        assert resolver.extract_project_name("alpha.module.func") == "alpha"
+        assert resolver.extract_project_name("alpha.module.func") == "alpha"
+        assert "alpha.module.func" in resolver._fqn_cache
+
+    def test_cache_invalidated_on_add_project(
+        self, resolver: ProjectPathResolver, tmp_path: Path
+    ) -> None:
+        assert resolver.extract_project_name("delta.module.func") == "delta"
+        new_dir = tmp_path / "delta_module"
+        new_dir.mkdir()
+        resolver.add_project("delta.module", new_dir)
+        assert resolver.extract_project_name("delta.module.func") == "delta.module"
+
+    def test_unknown_project_falls_back_to_first_segment(
+        self, resolver: ProjectPathResolver
+    ) -> None:
+        assert resolver.extract_project_name("delta.module.func") == "delta"
+
+    def test_deeper_key_beats_lexically_longer_key(self, tmp_path: Path) -> None:
+        mappings: dict[str, str | Path] = {
+            "averylongprojectname": tmp_path,
+            "ab.cd": tmp_path,
+        }
+        resolver = ProjectPathResolver(mappings)
+        assert resolver.extract_project_name("ab.cd.module.func") == "ab.cd"
+        assert (
+            resolver.extract_project_name("averylongprojectname.module.func")
+            == "averylongprojectname"
+        )
+
+    def test_single_project_fast_path(self, tmp_path: Path) -> None:
+        mappings: dict[str, str | Path] = {"solo": tmp_path}
+        resolver = ProjectPathResolver(mappings)
+        assert resolver.extract_project_name("solo.module.func") == "solo"
+        assert resolver.extract_project_name("solo") == "solo"
+        assert resolver.extract_project_name("other.module.func") == "other"
+
+
+class TestProjectMappings:
+    def test_get_project_path_resolves(
+        self, resolver: ProjectPathResolver, project_dirs: dict[str, Path]
+    ) -> None:
+        assert resolver.get_project_path("alpha") == project_dirs["alpha"].resolve()
+
+    def test_get_project_path_unknown_raises(
+        self, resolver: ProjectPathResolver
+    ) -> None:
+        with pytest.raises(KeyError, match="Unknown project 'delta'"):
+            resolver.get_project_path("delta")
+
+    def test_resolve_path_from_fqn(
+        self, resolver: ProjectPathResolver, project_dirs: dict[str, Path]
+    ) -> None:
+        result = resolver.resolve_path_from_fqn("beta.module.Class.method")
+        assert result == project_dirs["beta"].resolve()
+
+    def test_resolve_path_from_fqn_unknown_raises(
+        self, resolver: ProjectPathResolver
+    ) -> None:
+        with pytest.raises(KeyError, match="Unknown project 'delta'"):
+            resolver.resolve_path_from_fqn("delta.module.func")
+
+    def test_add_project(self, resolver: ProjectPathResolver, tmp_path: Path) -> None:
+        new_dir = tmp_path / "delta"
+        new_dir.mkdir()
+        resolver.add_project("delta", new_dir)
+        assert resolver.extract_project_name("delta.module.func") == "delta"
+        assert resolver.get_project_path("delta") == new_dir.resolve()
+
+    def test_remove_project(self, resolver: ProjectPathResolver) -> None:
+        resolver.remove_project("gamma")
+        with pytest.raises(KeyError, match="Unknown project 'gamma'"):
+            resolver.get_project_path("gamma")
+
+    def test_remove_unknown_project_raises(self, resolver: ProjectPathResolver) -> None:
+        with pytest.raises(KeyError, match="Unknown project 'delta'"):
+            resolver.remove_project("delta")
+
+    def test_extract_project_names_batch(self, resolver: ProjectPathResolver) -> None:
+        fqns = ["alpha.module.func", "beta.module.Class", "delta.module.func"]
+        assert resolver.extract_project_names(fqns) == ["alpha", "beta", "delta"]
+
+    def test_extract_project_names_batch_single_project(self, tmp_path: Path) -> None:
+        mappings: dict[str, str | Path] = {"solo": tmp_path}
+        resolver = ProjectPathResolver(mappings)
+        fqns = ["solo.module.func", "solo", "other.module.func"]
+        assert resolver.extract_project_names(fqns) == ["solo", "solo", "other"]
+
+    def test_resolve_paths_from_fqns_batch(
+        self, resolver: ProjectPathResolver, project_dirs: dict[str, Path]
+    ) -> None:
+        fqns = ["alpha.module.func", "beta.module.Class"]
+        assert resolver.resolve_paths_from_fqns(fqns) == [
+            project_dirs["alpha"].resolve(),
+            project_dirs["beta"].resolve(),
+        ]
+
+    def test_resolve_paths_from_fqns_unknown_raises(
+        self, resolver: ProjectPathResolver
+    ) -> None:
+        with pytest.raises(KeyError, match="Unknown project 'delta'"):
+            resolver.resolve_paths_from_fqns(["alpha.module.func", "delta.mod.f"])
+
+    def test_default_mapping_uses_settings(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from codebase_rag.config import settings
+
+        repo_dir = tmp_path / "myrepo"
+        repo_dir.mkdir()
+        monkeypatch.setattr(settings, "TARGET_REPO_PATH", str(repo_dir))
+        resolver = ProjectPathResolver()
+        assert resolver.get_project_path("myrepo") == repo_dir.resolve()